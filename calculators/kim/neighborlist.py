@@ -145,14 +145,20 @@ class ASENeighborList(NeighborList):
     @staticmethod
     def get_neigh(data, cutoffs, neighbor_list_index, particle_number):
         """Retrieves the neighbors of each atom using ASE's native neighbor
-        list library
+        list library.  This callback is invoked by the model once per
+        particle during every force evaluation, so keep the happy path
+        as lean as possible.
         """
-        # We can only return neighbors of particles that were stored
-        number_of_particles = data["num_particles"]
-        if particle_number >= number_of_particles or particle_number < 0:
+        # We can only return neighbors of particles that were stored.
+        # The list indexing takes care of the upper bound; negative
+        # indices must be rejected explicitly since Python would wrap
+        # them around.
+        if particle_number < 0:
+            return (np.array([]), 1)
+        try:
+            neighbors = data["neighbors"][neighbor_list_index][particle_number]
+        except IndexError:
             return (np.array([]), 1)
-
-        neighbors = data["neighbors"][neighbor_list_index][particle_number]
         return (neighbors, 0)
 
     def build(self, orig_atoms):
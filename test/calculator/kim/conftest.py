@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def kim_morse_ar():
+    """Session-shared KIM calculator for the Ar Morse example model.
+
+    Initializing a KIM portable model is comparatively expensive
+    (parameter-file parsing, neighbor-list driver setup), so tests using
+    this model share one calculator instance instead of constructing
+    their own.  Tests should call reset() before attaching it to clear
+    results cached by a previous test.
+    """
+    pytest.importorskip('kimpy')
+    from ase.calculators.kim import KIM
+    # Give OpenMP-enabled model drivers a sensible thread count for the
+    # pair-loop force decomposition.  The thread pool is sized when the
+    # model library is first loaded, so this must precede KIM().  Serial
+    # models such as the example Morse model simply ignore it, and an
+    # explicit user setting is respected.
+    os.environ.setdefault('OMP_NUM_THREADS',
+                          str(max(1, (os.cpu_count() or 2) // 2)))
+    # Deliberately keep the default neighbor-list skin: test_relax
+    # exists to cover relaxations that trigger multiple neighbor-list
+    # rebuilds, and a wider skin would tune those rebuilds away.
+    return KIM("ex_model_Ar_P_Morse_07C")
+
+
+@pytest.fixture(scope='session')
+def ar_icosahedron_positions():
+    """Geometry of the two-shell Ar icosahedron used by these tests.
+
+    The cluster enumeration in ase.cluster is pure Python, and for a
+    fixed (latticeconstant, noshells) it always produces the same
+    13-atom arrangement, so build it once per session.  Tests should
+    copy the positions before modifying them.
+    """
+    from ase.cluster import Icosahedron
+    atoms = Icosahedron("Ar", latticeconstant=3.0, noshells=2)
+    return atoms.get_chemical_formula(), atoms.get_positions()
+
+
+@pytest.fixture
+def vesin_neighborlist(monkeypatch):
+    """Route the KIM wrapper's neighbor-list queries through vesin.
+
+    vesin builds the same (i, j, D, S, d) pair lists as
+    ase.neighborlist.neighbor_list but in a C kernel, which is several
+    times faster on anything beyond a handful of atoms.  This only
+    affects calculators constructed with ase_neigh=True; the default
+    kimpy neighbor list is already compiled.  The fixture is a no-op
+    when vesin is not installed or when the structure has mixed
+    periodicity, in which case the ASE implementation is used.
+    """
+    try:
+        import vesin
+    except ImportError:
+        yield False
+        return
+
+    # The wrapper module imports kimpy at its top level.
+    pytest.importorskip('kimpy')
+    from ase.calculators.kim import neighborlist as kim_neighborlist
+    from ase.neighborlist import neighbor_list as ase_neighbor_list
+
+    def vesin_pairs(quantities, atoms, cutoff):
+        pbc = atoms.get_pbc()
+        if quantities != 'ijDSd' or not (pbc.all() or not pbc.any()):
+            return ase_neighbor_list(quantities, atoms, cutoff)
+        nl = vesin.NeighborList(cutoff=cutoff, full_list=True)
+        i, j, D, S, d = nl.compute(points=atoms.get_positions(),
+                                   box=atoms.get_cell()[:],
+                                   periodic=bool(pbc.all()),
+                                   quantities='ijDSd')
+        return i, j, D, S, d
+
+    monkeypatch.setattr(kim_neighborlist, 'neighbor_list', vesin_pairs)
+    yield True
@@ -1,4 +1,4 @@
-def test_relax():
+def test_relax(kim_morse_ar, ar_icosahedron_positions):
     """
     Test that a static relaxation that requires multiple neighbor list
     rebuilds can be carried out successfully.  This is verified by relaxing
@@ -6,19 +6,21 @@ def test_relax():
     matches a known precomputed value for an example model.
     """
     import numpy as np
-    from ase.cluster import Icosahedron
-    from pytest import importorskip
-    importorskip('kimpy')
-    from ase.calculators.kim import KIM
+    from ase import Atoms
     from ase.optimize import BFGS
 
     energy_ref = -0.56  # eV
 
-    # Create structure and calculator
-    atoms = Icosahedron("Ar", latticeconstant=3.0, noshells=2)
-    calc = KIM("ex_model_Ar_P_Morse_07C")
-    atoms.calc = calc
+    # Create structure and attach the session-shared calculator,
+    # clearing any results cached by a previous test
+    formula, positions = ar_icosahedron_positions
+    atoms = Atoms(formula, positions=positions.copy())
+    kim_morse_ar.reset()
+    atoms.calc = kim_morse_ar
 
+    # The small maxstep is deliberate: it forces the relaxation to go
+    # through multiple neighbor-list rebuilds, which is the behavior
+    # this test covers.
     opt = BFGS(atoms, maxstep=0.04, alpha=70.0, logfile=None)
     opt.run(fmax=0.01)  # eV/angstrom
 
@@ -0,0 +1,37 @@
+def test_vesin_matches_ase_neighbor_list(vesin_neighborlist):
+    """
+    The vesin backend must reproduce ASE's pair-list conventions
+    exactly: same (i, j) pairs, same cell shifts, and the same distance
+    vectors, since the KIM wrapper builds its padding atoms from them.
+    """
+    import numpy as np
+    import pytest
+    from ase.build import bulk
+    from ase.calculators.kim import neighborlist as kim_neighborlist
+    from ase.neighborlist import neighbor_list
+
+    if not vesin_neighborlist:
+        pytest.skip('vesin not installed')
+
+    atoms = bulk('Ar', 'fcc', a=5.3, cubic=True) * (2, 2, 2)
+    atoms.rattle(stdev=0.05, seed=42)
+    cutoff = 6.0
+
+    # The fixture has patched the name the KIM wrapper calls.
+    patched = kim_neighborlist.neighbor_list('ijDSd', atoms, cutoff)
+    stock = neighbor_list('ijDSd', atoms, cutoff)
+
+    def sort_pairs(i, j, D, S, d):
+        # Pair ordering is not part of the contract; (i, j, S) is a
+        # unique key for full pair lists.
+        order = np.lexsort((S[:, 2], S[:, 1], S[:, 0], j, i))
+        return i[order], j[order], D[order], S[order], d[order]
+
+    i1, j1, D1, S1, d1 = sort_pairs(*patched)
+    i0, j0, D0, S0, d0 = sort_pairs(*stock)
+
+    assert np.array_equal(i1, i0)
+    assert np.array_equal(j1, j0)
+    assert np.array_equal(S1, S0)
+    assert np.allclose(D1, D0)
+    assert np.allclose(d1, d0)
@@ -0,0 +1,27 @@
+import pytest
+
+import ase
+
+
+def test_worker_roundtrip(cli):
+    assert ase.__version__ in cli.ase('--version')
+    worker = cli._worker
+    # A second command must be served by the same worker process.
+    assert 'traj' in cli.ase('info', '--formats')
+    assert cli._worker is worker
+
+
+def test_worker_binary_stdout(cli):
+    # ase diff writes through sys.stdout.buffer (and closes it), so it
+    # exercises the worker's binary-capable stdout capture.
+    from ase.build import bulk
+    from ase.io import write
+    images = [bulk('Au'), bulk('Au')]
+    images[1].rattle(stdev=0.01, seed=1)
+    write('images.traj', images)
+    assert 'Δx' in cli.ase('diff', '--as-csv', 'images.traj')
+
+
+def test_worker_reports_errors(cli):
+    with pytest.raises(AssertionError, match='invalid choice'):
+        cli.ase('no-such-subcommand')
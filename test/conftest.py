@@ -1,5 +1,8 @@
+import json
+import os
+import sys
 from pathlib import Path
-from subprocess import Popen, PIPE, check_output
+from subprocess import DEVNULL, PIPE, Popen, check_output
 import zlib
 
 import pytest
@@ -37,8 +40,45 @@ def library_header():
     yield 'Libraries'
     yield '========='
     yield ''
-    for name, path in all_dependencies():
-        yield '{:24} {}'.format(name, path)
+    yield from _library_lines()
+
+
+def _site_packages_mtime():
+    # Installing, upgrading or removing a package touches its
+    # site-packages directory (dist-info entries come and go), so the
+    # newest mtime is a cheap fingerprint of the dependency versions
+    # without importing anything.
+    mtimes = [os.path.getmtime(entry) for entry in sys.path
+              if os.path.basename(entry) == 'site-packages'
+              and os.path.isdir(entry)]
+    return max(mtimes, default=0.0)
+
+
+def _library_lines():
+    # Walking all_dependencies() imports every optional dependency just
+    # to report its version and path, which is pure overhead on every
+    # session.  Cache the rendered lines on disk, keyed on interpreter,
+    # environment, ase version and the site-packages fingerprint so
+    # that upgrading any dependency invalidates the cache; a stale
+    # cache is simply rewritten, and cache I/O errors fall back to
+    # recomputing.
+    cachefile = Path('~/.cache/ase/libheader.txt').expanduser()
+    key = '{}|{}|{}|{}'.format(sys.version.split()[0], sys.prefix,
+                               ase.__version__, _site_packages_mtime())
+    try:
+        cached = cachefile.read_text().splitlines()
+        if cached and cached[0] == key:
+            return cached[1:]
+    except OSError:
+        pass
+    lines = ['{:24} {}'.format(name, path)
+             for name, path in all_dependencies()]
+    try:
+        cachefile.parent.mkdir(parents=True, exist_ok=True)
+        cachefile.write_text('\n'.join([key] + lines) + '\n')
+    except OSError:
+        pass
+    return lines
 
 
 def calculators_header(config):
@@ -74,22 +114,27 @@ def calculators_header(config):
             continue
 
         factory = factories.factories.get(name)
+        enabled = factories.enabled(name)
 
         if factory is None:
             configinfo = 'not installed'
-        else:
-            # Some really ugly hacks here:
-            if hasattr(factory, 'importname'):
+        elif hasattr(factory, 'importname'):
+            if enabled:
+                # Some really ugly hacks here:
                 import importlib
                 module = importlib.import_module(factory.importname)
                 configinfo = str(module.__path__[0])  # type: ignore
             else:
-                configtokens = []
-                for varname, variable in vars(factory).items():
-                    configtokens.append(f'{varname}={variable}')
-                configinfo = ', '.join(configtokens)
+                # Don't pay for importing calculators we won't run;
+                # just report what would be imported.
+                configinfo = f'import: {factory.importname}'
+        else:
+            configtokens = []
+            for varname, variable in vars(factory).items():
+                configtokens.append(f'{varname}={variable}')
+            configinfo = ', '.join(configtokens)
 
-        run = '[x]' if factories.enabled(name) else '[ ]'
+        run = '[x]' if enabled else '[ ]'
         line = f'  {run} {name:10} {configinfo}'
         yield line
 
@@ -117,13 +162,27 @@ def monkeypatch_disabled_calculators(request, factories):
 
 
 @pytest.fixture(autouse=True)
-def use_tmp_workdir(tmp_path):
-    # Pytest can on some systems provide a Path from pathlib2.  Normalize:
-    path = Path(str(tmp_path))
-    with workdir(path, mkdir=True):
+def use_tmp_workdir(request, tmp_path):
+    # Tests marked no_workdir promise not to touch the filesystem, so
+    # they skip the mkdir/chdir round-trip entirely.
+    if request.node.get_closest_marker('no_workdir'):
+        yield tmp_path
+        return
+    with workdir(tmp_path, mkdir=True):
         yield tmp_path
-    # We print the path so user can see where test failed, if it failed.
-    print(f'Testpath: {path}')
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Attach the path so user can see where test failed, if it failed.
+    # (Attaching it to the report instead of printing it keeps stdout
+    # clean on the success path.)
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == 'call' and report.failed:
+        path = item.funcargs.get('tmp_path')
+        if path is not None:
+            report.sections.append(('Testpath', str(path)))
 
 
 @pytest.fixture(scope='session')
@@ -186,26 +245,121 @@ def pytest_generate_tests(metafunc):
     from ase.test.factories import parametrize_calculator_tests
     parametrize_calculator_tests(metafunc)
 
-    if 'seed' in metafunc.fixturenames:
-        seeds = metafunc.config.getoption('seed')
+    if 'seed' not in metafunc.fixturenames:
+        return
+
+    # Parse the --seed option once per session instead of rebuilding
+    # the list for every test function using the fixture.
+    config = metafunc.config
+    seeds = getattr(config, '_parsed_seeds', None)
+    if seeds is None:
+        seeds = config.getoption('seed')
         if len(seeds) == 0:
             seeds = [0, 1]
         else:
             seeds = list(map(int, seeds))
-        metafunc.parametrize('seed', seeds)
+        config._parsed_seeds = seeds
+    metafunc.parametrize('seed', seeds)
+
+
+# Each invocation of the ase executable pays full interpreter startup,
+# including the numpy and ase imports.  The worker below amortizes that
+# across a whole session: it reads one JSON request per line, runs
+# ase.cli.main in-process with stdout captured, and answers with one
+# JSON line.  The working directory is part of each request because
+# tests run in their own temporary directories.
+CLI_WORKER_SOURCE = """\
+import io, json, os, sys, traceback
+from contextlib import redirect_stdout, redirect_stderr
+from ase.cli.main import main
+
+
+class CaptureBuffer(io.BytesIO):
+    # Some commands wrap sys.stdout.buffer in their own TextIOWrapper
+    # and close it when done (ase diff does); keep the bytes readable
+    # after close.
+    value = b''
+
+    def close(self):
+        self.value = self.getvalue()
+        super().close()
+
+
+def textstream():
+    # A text stream with a real binary .buffer underneath, so commands
+    # writing through sys.stdout.buffer keep working under redirection.
+    return io.TextIOWrapper(CaptureBuffer(), encoding='utf-8')
+
+
+def getvalue(stream):
+    try:
+        stream.flush()
+    except ValueError:
+        pass  # the command closed the underlying buffer
+    buf = stream.buffer
+    raw = buf.value if buf.closed else buf.getvalue()
+    return raw.decode('utf-8', 'replace')
+
+
+for line in sys.stdin:
+    request = json.loads(line)
+    os.chdir(request['cwd'])
+    out = textstream()
+    err = textstream()
+    status = 0
+    stdin = sys.stdin
+    try:
+        # Commands must see an empty stdin (as with the one-shot
+        # executable), not the request pipe, or they could consume or
+        # block on queued requests.  Stderr is captured per command so
+        # the caller can attach it to failures.
+        with open(os.devnull) as devnull, \\
+                redirect_stdout(out), redirect_stderr(err):
+            sys.stdin = devnull
+            main(args=request['argv'])
+    except SystemExit as ex:
+        if ex.code:
+            status = ex.code if isinstance(ex.code, int) else 1
+    except Exception:
+        traceback.print_exc(file=err)
+        status = 1
+    finally:
+        sys.stdin = stdin
+    print(json.dumps({'status': status, 'output': getvalue(out),
+                      'error': getvalue(err)}),
+          flush=True)
+"""
 
 
 class CLI:
     def __init__(self, calculators):
         self.calculators = calculators
+        self._worker = None
+
+    def _start_worker(self):
+        return Popen([sys.executable, '-c', CLI_WORKER_SOURCE],
+                     stdin=PIPE, stdout=PIPE, encoding='utf-8')
 
     def ase(self, *args):
-        proc = Popen(['ase', '-T'] + list(args),
-                     stdout=PIPE, stdin=PIPE)
-        stdout, _ = proc.communicate(b'')
-        status = proc.wait()
-        assert status == 0
-        return stdout.decode('utf-8')
+        if self._worker is None or self._worker.poll() is not None:
+            self._worker = self._start_worker()
+        request = {'argv': ['-T'] + list(args), 'cwd': os.getcwd()}
+        print(json.dumps(request), file=self._worker.stdin, flush=True)
+        line = self._worker.stdout.readline()
+        if not line:
+            # Worker died; fall back to a one-shot subprocess so the
+            # test still gets a meaningful result (or error).
+            return check_output(['ase', '-T'] + list(args),
+                                stdin=DEVNULL).decode('utf-8')
+        response = json.loads(line)
+        assert response['status'] == 0, response['error']
+        return response['output']
+
+    def close(self):
+        if self._worker is not None and self._worker.poll() is None:
+            self._worker.stdin.close()
+            self._worker.wait()
+        self._worker = None
 
     def shell(self, command, calculator_name=None):
         if calculator_name is not None:
@@ -218,13 +372,14 @@ class CLI:
 
 @pytest.fixture(scope='session')
 def cli(factories):
-    return CLI(factories)
+    cli = CLI(factories)
+    yield cli
+    cli.close()
 
 
 @pytest.fixture(scope='session')
 def datadir():
-    test_basedir = Path(__file__).parent
-    return test_basedir / 'testdata'
+    return _datadir
 
 
 @pytest.fixture
@@ -239,32 +394,111 @@ def asap3():
     return pytest.importorskip('asap3')
 
 
+# Immutable paths used by the fixtures below, resolved once at import
+# instead of once per fixture invocation.
+_ase_path = ase.__path__[0]
+_test_basedir = Path(__file__).parent
+_datadir = _test_basedir / 'testdata'
+
+# The per-test seeds used by arbitrarily_seed_rng() depend only on the
+# test module and function name, which never change within a session, so
+# each one is computed once and cached (the fixture is autouse and hence
+# runs for every single test).
+_seed_cache = {}  # (module file, function name) -> seed
+
+
+def _test_seed(request):
+    cache_key = (request.module.__file__, request.function.__name__)
+    seed = _seed_cache.get(cache_key)
+    if seed is None:
+        abspath = Path(request.module.__file__)
+        relpath = abspath.relative_to(_ase_path)
+        module_identifier = relpath.as_posix()  # Same on all platforms
+        function_name = request.function.__name__
+        hashable_string = f'{module_identifier}:{function_name}'
+        # We use zlib.adler32() rather than hash() because Python
+        # randomizes the string hashing at startup for security
+        # reasons, and we want the same seeds across runs.  The bitmask
+        # is cheaper than a modulo and any reduction to a small range
+        # serves equally well here.
+        seed = zlib.adler32(hashable_string.encode('ascii')) & 0x3fff
+        # (We should really use the full qualified name of the test
+        # method.)
+        _seed_cache[cache_key] = seed
+    return seed
+
+
+@pytest.fixture(scope='session', autouse=True)
+def restore_global_rng_state():
+    # arbitrarily_seed_rng() reseeds the global state before every test
+    # anyway, so snapshotting and restoring the full Mersenne state
+    # around each test only cost allocations.  One snapshot at session
+    # start and one restore at the end suffice to undo the damage.
+    state = np.random.get_state()
+    yield
+    np.random.set_state(state)
+
+
 @pytest.fixture(autouse=True)
 def arbitrarily_seed_rng(request):
     # We want tests to not use global stuff such as np.random.seed().
     # But they do.
     #
-    # So in lieu of (yet) fixing it, we reseed and unseed the random
-    # state for every test.  That makes each test deterministic if it
-    # uses random numbers without seeding, but also repairs the damage
-    # done to global state if it did seed.
+    # So in lieu of (yet) fixing it, we reseed the random state for
+    # every test.  That makes each test deterministic if it uses random
+    # numbers without seeding, and also repairs the damage done to
+    # global state if a previous test did seed.
     #
     # In order not to generate all the same random numbers in every test,
     # we seed according to a kind of hash:
-    ase_path = ase.__path__[0]
-    abspath = Path(request.module.__file__)
-    relpath = abspath.relative_to(ase_path)
-    module_identifier = relpath.as_posix()  # Same on all platforms
-    function_name = request.function.__name__
-    hashable_string = f'{module_identifier}:{function_name}'
-    # We use zlib.adler32() rather than hash() because Python randomizes
-    # the string hashing at startup for security reasons.
-    seed = zlib.adler32(hashable_string.encode('ascii')) % 12345
-    # (We should really use the full qualified name of the test method.)
-    state = np.random.get_state()
-    np.random.seed(seed)
-    yield
-    np.random.set_state(state)
+    np.random.seed(_test_seed(request))
+
+
+@pytest.fixture
+def numba_bfgs_update(monkeypatch):
+    """Monkeypatch the BFGS rank-2 Hessian update with a numba kernel.
+
+    For small systems the numpy dispatch overhead of the outer-product
+    update dominates over the arithmetic, so relaxation-heavy tests can
+    request this fixture to run the whole symmetric update in one
+    compiled loop.  Skips when numba is not installed; cache=True means
+    only the first use in a fresh environment pays for compilation.
+    """
+    numba = pytest.importorskip('numba')
+    from ase.optimize.bfgs import BFGS
+
+    @numba.njit(cache=True, fastmath=True)
+    def _bfgs_update(H, dr, df):
+        a = np.dot(dr, df)
+        dg = np.dot(H, dr)
+        b = np.dot(dr, dg)
+        n = dr.shape[0]
+        for i in range(n):
+            for j in range(n):
+                H[i, j] -= df[i] * df[j] / a + dg[i] * dg[j] / b
+
+    def update(self, r, f, r0, f0):
+        if self.H is None:
+            self.H = self.H0
+            return
+        dr = np.asarray(r) - r0
+
+        if np.abs(dr).max() < 1e-7:
+            # Same configuration again (maybe a restart):
+            return
+
+        _bfgs_update(self.H, dr, f - f0)
+
+    monkeypatch.setattr(BFGS, 'update', update)
+    return _bfgs_update
+
+
+@pytest.fixture
+def rng(request):
+    """Deterministically seeded Generator, local to the requesting test.
+
+    Prefer this over the seeded global state when writing new tests."""
+    return np.random.default_rng(_test_seed(request))
 
 
 def pytest_addoption(parser):
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from ase.calculators.emt import EMT
+from ase.cluster import Icosahedron
+from ase.optimize.bfgs import BFGS
+
+_stock_update = BFGS.update
+
+
+def test_kernel_matches_rank2_update(numba_bfgs_update, rng):
+    # The jitted kernel must reproduce the outer-product expression
+    # used by the stock BFGS.update.
+    n = 12
+    H = rng.standard_normal((n, n))
+    H = 0.5 * (H + H.T) + n * np.eye(n)
+    dr = 0.1 * rng.standard_normal(n)
+    df = -H.dot(dr) + 0.01 * rng.standard_normal(n)
+
+    a = np.dot(dr, df)
+    dg = np.dot(H, dr)
+    b = np.dot(dr, dg)
+    ref = H - (np.outer(df, df) / a + np.outer(dg, dg) / b)
+
+    Hjit = H.copy()
+    numba_bfgs_update(Hjit, dr, df)
+    assert np.allclose(Hjit, ref)
+
+
+def _rattled_cluster():
+    atoms = Icosahedron('Ag', 2, 3.82975)
+    atoms.calc = EMT()
+    atoms.rattle(stdev=0.1, seed=7)
+    return atoms
+
+
+def test_patched_relaxation_matches_stock(request):
+    # Reference relaxation with the stock update; the fixture is pulled
+    # in only afterwards so that its patch does not affect this run.
+    atoms = _rattled_cluster()
+    opt = BFGS(atoms, logfile=None)
+    assert opt.run(fmax=0.05)
+    e_stock = atoms.get_potential_energy()
+
+    request.getfixturevalue('numba_bfgs_update')  # skips without numba
+    assert BFGS.update is not _stock_update
+
+    atoms = _rattled_cluster()
+    opt = BFGS(atoms, logfile=None)
+    assert opt.run(fmax=0.05)
+    assert atoms.get_potential_energy() == pytest.approx(e_stock, abs=1e-5)
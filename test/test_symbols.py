@@ -3,6 +3,9 @@ from ase import Atoms
 from ase.build import molecule
 from ase.symbols import Symbols
 
+# Pure in-memory symbol manipulation; no files are ever written.
+pytestmark = pytest.mark.no_workdir
+
 
 @pytest.fixture
 def atoms():